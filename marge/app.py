@@ -2,6 +2,7 @@
 An auto-merger of merge requests for GitLab
 """
 
+import collections
 import contextlib
 import logging
 import logging.handlers
@@ -15,6 +16,7 @@ import time
 from datetime import timedelta
 
 import configargparse
+import yaml
 
 from . import bot
 from . import error
@@ -28,27 +30,61 @@ class MargeBotCliArgError(Exception):
     pass
 
 
+_TIME_INTERVAL_RE = re.compile(r'\A([\d.]+) ?(h|m(?:in)?|s)?\Z')
+_TIME_INTERVAL_UNITS = {'h': 'hours', 'm': 'minutes', 'min': 'minutes', 's': 'seconds', None: 'seconds'}
+
+
 def time_interval(str_interval):
     try:
-        quant, unit = re.match(r'\A([\d.]+) ?(h|m(?:in)?|s)?\Z', str_interval).groups()
-        translate = {'h': 'hours', 'm': 'minutes', 'min': 'minutes', 's': 'seconds'}
-        return timedelta(**{translate[unit or 's']: float(quant)})
+        quant, unit = _TIME_INTERVAL_RE.match(str_interval).groups()
+        return timedelta(**{_TIME_INTERVAL_UNITS[unit]: float(quant)})
     except (AttributeError, ValueError):
         raise configargparse.ArgumentTypeError('Invalid time interval (e.g. 12[s|min|h]): %s' % str_interval)
 
 
-def _parse_config(args):
+# Prefer the LibYAML bindings, which are a lot faster than the pure-python loader.
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
-    def regexp(str_regex):
+class _YAMLConfigFileParser(configargparse.YAMLConfigFileParser):
+    """YAMLConfigFileParser that parses with LibYAML when it is available."""
+
+    def parse(self, stream):
+        """Parses the keys and values from a config file."""
         try:
-            return re.compile(str_regex)
-        except re.error as err:
-            raise configargparse.ArgumentTypeError('Invalid regexp: %r (%s)' % (str_regex, err.msg))
+            parsed_obj = yaml.load(stream, Loader=_YAML_LOADER)
+        except Exception as e:  # pylint: disable=broad-except
+            raise configargparse.ConfigFileParserException("Couldn't parse config file: %s" % e)
+
+        if not isinstance(parsed_obj, dict):
+            raise configargparse.ConfigFileParserException(
+                "The config file doesn't appear to contain 'key: value' pairs (aka. a YAML mapping). "
+                "yaml.load('%s') returned type '%s' instead of 'dict'." % (
+                    getattr(stream, 'name', 'stream'), type(parsed_obj).__name__)
+            )
+
+        result = collections.OrderedDict()
+        for key, value in parsed_obj.items():
+            if isinstance(value, list):
+                result[key] = value
+            else:
+                result[key] = str(value)
+
+        return result
+
+
+def _regexp_type(str_regex):
+    try:
+        return re.compile(str_regex)
+    except re.error as err:
+        raise configargparse.ArgumentTypeError('Invalid regexp: %r (%s)' % (str_regex, err.msg))
+
 
+def _build_parser():
     parser = configargparse.ArgParser(
         auto_env_var_prefix='MARGE_',
         ignore_unknown_config_file_keys=True,  # Don't parse unknown args
-        config_file_parser_class=configargparse.YAMLConfigFileParser,
+        config_file_parser_class=_YAMLConfigFileParser,
         formatter_class=configargparse.ArgumentDefaultsRawHelpFormatter,
         description=__doc__,
     )
@@ -168,7 +204,7 @@ def _parse_config(args):
     )
     parser.add_argument(
         '--project-regexp',
-        type=regexp,
+        type=_regexp_type,
         default='.*',
         help="Only process projects that match; e.g. 'some_group/.*' or '(?!exclude/me)'.\n",
     )
@@ -206,7 +242,7 @@ def _parse_config(args):
     )
     parser.add_argument(
         '--branch-regexp',
-        type=regexp,
+        type=_regexp_type,
         default='.*',
         help='Only process MRs whose target branches match the given regular expression.\n',
     )
@@ -225,7 +261,17 @@ def _parse_config(args):
         action='store_true',
         help='Skip to next MR if oldest MR is not ready (otherwise, wait until it is)'
     )
-    config = parser.parse_args(args)
+    return parser
+
+
+# Built once at import, as argparse setup is a noticeable part of startup.
+# `_parse_config` reads `_source_to_settings` straight after `parse_args`,
+# which resets it on every call, so the shared parser is not thread-safe.
+_PARSER = _build_parser()
+
+
+def _parse_config(args):
+    config = _PARSER.parse_args(args)
 
     if config.use_merge_strategy:
         config.merge_strategy = job.MergeStrategy.merge
@@ -239,7 +285,7 @@ def _parse_config(args):
 
     cli_args = []
     # pylint: disable=protected-access
-    for _, (_, value) in parser._source_to_settings.get(configargparse._COMMAND_LINE_SOURCE_KEY, {}).items():
+    for _, (_, value) in _PARSER._source_to_settings.get(configargparse._COMMAND_LINE_SOURCE_KEY, {}).items():
         cli_args.extend(value)
     for bad_arg in ['--auth-token', '--ssh-key']:
         if bad_arg in cli_args:
@@ -262,27 +308,49 @@ def _secret_auth_token_and_ssh_key(options):
                 tmp_ssh_key_file.close()
 
 
+class _UTCFormatter(logging.Formatter):
+    """Formatter that timestamps records in UTC, e.g. 2018-03-01T12:00:00+0000.
+
+    The timestamp has second resolution, so it is only rendered once per second
+    rather than once per record (which adds up with --debug HTTP tracing).
+    """
+
+    _last_timestamp = (None, None)
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        last_second, last_formatted = self._last_timestamp
+        if second != last_second:
+            last_formatted = time.strftime('%Y-%m-%dT%H:%M:%S+0000', time.gmtime(second))
+            self._last_timestamp = (second, last_formatted)
+        return last_formatted
+
+
 def setup_logging(app_name, version):
     """Setup logging such that google-fluentd can parse it.
 
         This should be the standard setup for python logging at groq.
         Since we have no libraries yet, just copy paste it :/
     """
-    # Seriously, this is how you log in UTC.
-    logging.Formatter.converter = time.gmtime
     # For marge, the user will always be the same, but I must stick to the
     # convention so google-fluentd matches it properly.
     me = pwd.getpwuid(os.geteuid()).pw_name
-    handler = logging.handlers.RotatingFileHandler(
+    file_handler = logging.handlers.RotatingFileHandler(
         '/var/log/groq/%s.%s.pylog' % (me, app_name),
-        'log/%s.marge.pylog' % (me,),
+        mode='a',
         maxBytes=4*1024*1024,
         backupCount=4,
     )
-    handler.setFormatter(logging.Formatter(
+    file_handler.setFormatter(_UTCFormatter(
         fmt='%(asctime)s:%(levelname)s:%(filename)s:%(lineno)d: %(message)s',
-        datefmt='%Y-%m-%dT%H:%M:%S%z',
     ))
+    # Batch up --debug chatter (HTTP traces etc.) into fewer writes; anything at
+    # INFO or above flushes straight away, as does logging.shutdown() at exit.
+    handler = logging.handlers.MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.INFO,
+        target=file_handler,
+    )
     logging.getLogger().addHandler(handler)
     logging.getLogger().setLevel(logging.DEBUG)
     # Standard startup stanza so we know what is running.
@@ -322,13 +390,13 @@ def main(args=None):
                 git_timeout=options.git_timeout,
                 git_reference_repo=options.git_reference_repo,
                 branch_regexp=options.branch_regexp,
-                merge_opts=bot.MergeJobOptions.default(
+                merge_opts=bot.MergeJobOptions(
                     add_tested=options.add_tested,
                     add_part_of=options.add_part_of,
                     add_reviewers=options.add_reviewers,
                     reapprove=options.impersonate_approvers,
                     approval_timeout=options.approval_reset_timeout,
-                    embargo=options.embargo,
+                    embargo=options.embargo or interval.IntervalUnion.empty(),
                     ci_timeout=options.ci_timeout,
                     ci_timeout_skip=options.ci_timeout_skip,
                     merge_strategy=options.merge_strategy,
@@ -1,10 +1,12 @@
 # pylint: disable=too-many-branches,too-many-statements
 import logging as log
+import threading
+from concurrent.futures import Future
 from time import sleep
 
 from . import git
 from .commit import Commit
-from .job import MergeJob, CannotMerge, SkipMerge
+from .job import MergeJob, CannotMerge, MR_INFO_MAX_AGE_SECS, SkipMerge
 from .merge_request import MergeRequest
 from .pipeline import Pipeline
 
@@ -68,20 +70,26 @@ class BatchMergeJob(MergeJob):
             if merge_request.target_branch == target_branch
         ]
 
-    def ensure_mergeable_mr(self, merge_request):
-        super().ensure_mergeable_mr(merge_request)
+    def ensure_mergeable_mr(self, merge_request, max_info_age=None):
+        if not self._project.only_allow_merge_if_pipeline_succeeds:
+            return super().ensure_mergeable_mr(merge_request, max_info_age=max_info_age)
 
-        if self._project.only_allow_merge_if_pipeline_succeeds:
-            ci_status = self.get_mr_ci_status(merge_request)
-            if ci_status != 'success':
-                raise CannotBatch('This MR has not passed CI.')
+        self.ensure_mr_state_ok(merge_request, max_info_age=max_info_age)
+        # Approvals and CI status are independent, so fetch them concurrently.
+        approvals = _call_in_background(merge_request.fetch_approvals)
+        ci_status = self.get_mr_ci_status(merge_request)
+        approvals = self.ensure_sufficient_approvals(approvals.result())
+        if ci_status != 'success':
+            raise CannotBatch('This MR has not passed CI.')
+
+        return approvals
 
     def get_mergeable_mrs(self, merge_requests):
         log.info('Filtering mergeable MRs')
         mergeable_mrs = []
         for merge_request in merge_requests:
             try:
-                self.ensure_mergeable_mr(merge_request)
+                self.ensure_mergeable_mr(merge_request, max_info_age=MR_INFO_MAX_AGE_SECS)
             except (CannotBatch, SkipMerge) as ex:
                 log.warning('Skipping unbatchable MR: "%s"', ex)
             except CannotMerge as ex:
@@ -112,10 +120,10 @@ class BatchMergeJob(MergeJob):
         self,
         merge_request,
         expected_remote_target_branch_sha,
+        approvals,
         source_repo_url=None,
     ):
         log.info('Fusing MR !%s', merge_request.iid)
-        approvals = merge_request.fetch_approvals()
 
         # Make sure latest commit in remote <target_branch> is the one we tested against
         new_target_sha = Commit.last_on_branch(self._project.id, merge_request.target_branch, self._api).id
@@ -126,6 +134,7 @@ class BatchMergeJob(MergeJob):
         _, _, actual_sha = self.update_from_target_branch_and_push(
             merge_request,
             source_repo_url=source_repo_url,
+            approvals=approvals,
         )
 
         sha_now = Commit.last_on_branch(
@@ -249,10 +258,11 @@ class BatchMergeJob(MergeJob):
                 # FIXME: this should probably be part of the merge request
                 _, source_repo_url, merge_request_remote = self.fetch_source_project(merge_request)
                 self.ensure_mr_not_changed(merge_request)
-                self.ensure_mergeable_mr(merge_request)
+                approvals = self.ensure_mergeable_mr(merge_request)
                 remote_target_branch_sha = self.accept_mr(
                     merge_request,
                     remote_target_branch_sha,
+                    approvals,
                     source_repo_url=source_repo_url,
                 )
             except CannotBatch as err:
@@ -269,3 +279,23 @@ class BatchMergeJob(MergeJob):
                 self.unassign_from_mr(merge_request)
                 merge_request.comment("I couldn't merge this branch: %s" % err.reason)
                 raise
+
+
+def _call_in_background(fun, *args):
+    """Call `fun(*args)` in a new thread; return a Future for its result.
+
+    This is a daemon thread rather than a ThreadPoolExecutor worker: API calls have
+    no timeout, and a worker stuck on one would keep the process from exiting (e.g.
+    on SIGTERM), as executors join their workers at exit.
+    """
+    future = Future()
+
+    def run():
+        if future.set_running_or_notify_cancel():
+            try:
+                future.set_result(fun(*args))
+            except Exception as exc:  # pylint: disable=broad-except
+                future.set_exception(exc)
+
+    threading.Thread(target=run, name='marge-api', daemon=True).start()
+    return future
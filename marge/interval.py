@@ -126,6 +126,9 @@ class IntervalUnion(object):
     def __repr__(self):
         return '{o.__class__.__name__}({o._intervals})'.format(o=self)
 
+    def __bool__(self):
+        return bool(self._intervals)
+
     @classmethod
     def empty(cls):
         return cls(())
@@ -1,9 +1,10 @@
 # pylint: disable=too-many-locals,too-many-branches,too-many-statements
 import enum
 import logging as log
+import random
 import time
-from collections import namedtuple
 from datetime import datetime, timedelta
+from typing import NamedTuple
 
 from . import git
 from .branch import Branch
@@ -33,6 +34,13 @@ class MergeJob(object):
         self._repo = repo
         self._options = options
         self._merge_timeout = timedelta(minutes=5)
+        self._source_projects = {}
+        self._protected_branches = {}
+        self._fuse_strategy = {
+            MergeStrategy.merge: repo.merge,
+            MergeStrategy.rebase: repo.rebase,
+            MergeStrategy.rebase_then_merge: self.rebase_then_merge,
+        }[options.merge_strategy]
 
     @property
     def repo(self):
@@ -45,8 +53,13 @@ class MergeJob(object):
     def execute(self):
         raise NotImplementedError
 
-    def ensure_mergeable_mr(self, merge_request):
-        merge_request.refetch_info()
+    def ensure_mergeable_mr(self, merge_request, max_info_age=None):
+        self.ensure_mr_state_ok(merge_request, max_info_age=max_info_age)
+        # Checked last, as it is the only check that needs another API call.
+        return self.ensure_sufficient_approvals(merge_request.fetch_approvals())
+
+    def ensure_mr_state_ok(self, merge_request, max_info_age=None):
+        merge_request.refetch_info(max_age=max_info_age)
         log.info('Ensuring MR !%s is mergeable', merge_request.iid)
         log.debug('Ensuring MR %r is mergeable', merge_request)
 
@@ -58,19 +71,12 @@ class MergeJob(object):
                 "Sorry, merging requests marked as auto-squash would ruin my commit tagging!"
             )
 
-        approvals = merge_request.fetch_approvals()
-        if not approvals.sufficient:
-            raise CannotMerge(
-                'Insufficient approvals '
-                '(have: {0.approver_usernames} missing: {0.approvals_left})'.format(approvals)
-            )
-
         state = merge_request.state
         if state not in ('opened', 'reopened', 'locked'):
             if state in ('merged', 'closed'):
-                raise SkipMerge('The merge request is already {}!'.format(state))
+                raise SkipMerge(f'The merge request is already {state}!')
             else:
-                raise CannotMerge('The merge request is in an unknown state: {}'.format(state))
+                raise CannotMerge(f'The merge request is in an unknown state: {state}')
 
         if self.during_merge_embargo():
             raise SkipMerge('Merge embargo!')
@@ -78,14 +84,22 @@ class MergeJob(object):
         if self._user.id not in merge_request.assignee_ids:
             raise SkipMerge('It is not assigned to me anymore!')
 
-    def add_trailers(self, merge_request):
+    def ensure_sufficient_approvals(self, approvals):
+        if not approvals.sufficient:
+            raise CannotMerge(
+                'Insufficient approvals '
+                f'(have: {approvals.approver_usernames} missing: {approvals.approvals_left})'
+            )
+        return approvals
+
+    def add_trailers(self, merge_request, approvals=None):
 
         log.info('Adding trailers for MR !%s', merge_request.iid)
 
         # add Reviewed-by
         reviewers = (
             _get_reviewer_names_and_emails(
-                merge_request.fetch_approvals(),
+                approvals or merge_request.fetch_approvals(),
                 self._api,
             ) if self._options.add_reviewers else None
         )
@@ -101,7 +115,7 @@ class MergeJob(object):
         # add Tested-by
         should_add_tested = self._options.add_tested and self._project.only_allow_merge_if_pipeline_succeeds
         tested_by = (
-            ['{0._user.name} <{1.web_url}>'.format(self, merge_request)] if should_add_tested
+            [f'{self._user.name} <{merge_request.web_url}>'] if should_add_tested
             else None
         )
         if tested_by is not None and self._options.merge_strategy == MergeStrategy.rebase:
@@ -114,7 +128,7 @@ class MergeJob(object):
 
         # add Part-of
         part_of = (
-            '<{0.web_url}>'.format(merge_request) if self._options.add_part_of
+            f'<{merge_request.web_url}>' if self._options.add_part_of
             else None
         )
         if part_of is not None:
@@ -134,7 +148,9 @@ class MergeJob(object):
             merge_request.source_branch,
             self._api,
             username=self._user.username if ci_run_by_me else None,
+            sha=commit_sha,
         )
+        # Older GitLabs ignore `sha`, so still make sure the pipeline is for this commit.
         current_pipeline = next(iter(pipeline for pipeline in pipelines if pipeline.sha == commit_sha), None)
 
         if current_pipeline:
@@ -146,8 +162,9 @@ class MergeJob(object):
         return ci_status
 
     def wait_for_ci_to_pass(self, merge_request, commit_sha=None):
-        time_0 = datetime.utcnow()
-        waiting_time_in_secs = 10
+        deadline = time.monotonic() + self._options.ci_timeout.total_seconds()
+        waiting_time_in_secs = _MIN_POLL_SECS
+        eager_queued_polls_left = _EAGER_QUEUED_POLLS
 
         if commit_sha is None:
             commit_sha = merge_request.sha
@@ -155,7 +172,7 @@ class MergeJob(object):
         ci_run_by_me = self._options.require_ci_run_by_me
 
         log.info('Waiting for CI to pass for MR !%s', merge_request.iid)
-        while datetime.utcnow() - time_0 < self._options.ci_timeout:
+        while time.monotonic() < deadline:
             ci_status = self.get_mr_ci_status(
                 merge_request, commit_sha=commit_sha, ci_run_by_me=ci_run_by_me)
             if ci_status == 'success':
@@ -180,8 +197,15 @@ class MergeJob(object):
             elif ci_status not in ('pending', 'running', 'created'):
                 log.warning('Suspicious CI status: %r', ci_status)
 
-            log.debug('Waiting for %s secs before polling CI status again', waiting_time_in_secs)
-            time.sleep(waiting_time_in_secs)
+            # A freshly queued pipeline may well start (and finish) any moment, so poll
+            # it eagerly for a little while; otherwise back off.
+            sleep_secs = _with_jitter(waiting_time_in_secs)
+            log.debug('Waiting for %s secs before polling CI status again', sleep_secs)
+            time.sleep(sleep_secs)
+            if ci_status in ('pending', 'created') and eager_queued_polls_left > 0:
+                eager_queued_polls_left -= 1
+            else:
+                waiting_time_in_secs = _backoff(waiting_time_in_secs)
 
         if self._options.ci_timeout_skip:
             raise SkipMerge('CI is taking too long.')
@@ -197,8 +221,11 @@ class MergeJob(object):
             merge_request.unassign()
 
     def during_merge_embargo(self):
+        embargo = self.opts.embargo
+        if not embargo:
+            return False
         now = datetime.utcnow()
-        return self.opts.embargo.covers(now)
+        return embargo.covers(now)
 
     def maybe_reapprove(self, merge_request, approvals):
         # Re-approve the merge request, in case us pushing it has removed approvals.
@@ -208,13 +235,17 @@ class MergeJob(object):
             def sufficient_approvals():
                 return merge_request.fetch_approvals().sufficient
             # Make sure we don't race by ensuring approvals have reset since the push
-            time_0 = datetime.utcnow()
-            waiting_time_in_secs = 5
+            deadline = time.monotonic() + self._options.approval_timeout.total_seconds()
+            waiting_time_in_secs = _MIN_POLL_SECS
             log.info('Checking if approvals have reset')
-            while sufficient_approvals() and datetime.utcnow() - time_0 < self._options.approval_timeout:
-                log.debug('Approvals haven\'t reset yet, sleeping for %s secs', waiting_time_in_secs)
-                time.sleep(waiting_time_in_secs)
-            if not sufficient_approvals():
+            sufficient = sufficient_approvals()
+            while sufficient and time.monotonic() < deadline:
+                sleep_secs = _with_jitter(waiting_time_in_secs)
+                log.debug('Approvals haven\'t reset yet, sleeping for %s secs', sleep_secs)
+                time.sleep(sleep_secs)
+                waiting_time_in_secs = _backoff(waiting_time_in_secs)
+                sufficient = sufficient_approvals()
+            if not sufficient:
                 approvals.reapprove()
 
     def fetch_source_project(self, merge_request):
@@ -231,23 +262,29 @@ class MergeJob(object):
         return source_project, remote_url, remote
 
     def get_source_project(self, merge_request):
-        source_project = self._project
-        if merge_request.source_project_id != self._project.id:
-            source_project = Project.fetch_by_id(
-                merge_request.source_project_id,
+        source_project_id = merge_request.source_project_id
+        if source_project_id == self._project.id:
+            return self._project
+        source_project = self._source_projects.get(source_project_id)
+        if source_project is None:
+            source_project = self._source_projects[source_project_id] = Project.fetch_by_id(
+                source_project_id,
                 api=self._api,
             )
         return source_project
 
+    def is_protected_branch(self, project_id, branch):
+        # Only needed to explain push failures, and those tend to repeat on retries.
+        key = (project_id, branch)
+        protected = self._protected_branches.get(key)
+        if protected is None:
+            branch_info = Branch.fetch_by_name(project_id, branch, self._api)
+            protected = self._protected_branches[key] = branch_info.protected
+        return protected
+
     def fuse(self, source, target, source_repo_url=None, local=False):
         # NOTE: this leaves git switched to branch_a
-        strategies = {
-            MergeStrategy.merge: self._repo.merge,
-            MergeStrategy.rebase: self._repo.rebase,
-            MergeStrategy.rebase_then_merge: self.rebase_then_merge
-        }
-        strategy = strategies[self._options.merge_strategy]
-        return strategy(
+        return self._fuse_strategy(
             source,
             target,
             source_repo_url=source_repo_url,
@@ -271,6 +308,7 @@ class MergeJob(object):
             merge_request,
             *,
             source_repo_url=None,
+            approvals=None,
     ):
         """Updates `target_branch` with commits from `source_branch`, optionally add trailers and push.
         The update strategy can either be rebase or merge. The default is rebase.
@@ -299,7 +337,7 @@ class MergeJob(object):
             target_sha = repo.get_commit_hash('origin/' + target_branch)
             if updated_sha == target_sha:
                 raise CannotMerge('these changes already exist in branch `{}`'.format(target_branch))
-            rewritten_sha = self.add_trailers(merge_request) or updated_sha
+            rewritten_sha = self.add_trailers(merge_request, approvals) or updated_sha
             branch_rewritten = rewritten_sha != updated_sha
             repo.push(source_branch, source_repo_url=source_repo_url, force=True)
             changes_pushed = True
@@ -314,10 +352,8 @@ class MergeJob(object):
                     .format(rewritten_sha, updated_sha, exc))
                 # raise CannotMerge('failed on filter-branch; check my logs!')
             if not changes_pushed:
-                if (
-                    branch_rewritten and Branch.fetch_by_name(
-                        merge_request.source_project_id, merge_request.source_branch, self._api,
-                    ).protected
+                if branch_rewritten and self.is_protected_branch(
+                        merge_request.source_project_id, merge_request.source_branch,
                 ):
                     raise CannotMerge('Sorry, I can\'t push rewritten changes to protected branches!')
                 raise CannotMerge(
@@ -335,60 +371,66 @@ class MergeJob(object):
                 repo.remove_branch(source_branch)
 
 
+# How old (in secs) MR info may be for checks that run right after the MRs were listed.
+# Checks made just before merging always refetch.
+MR_INFO_MAX_AGE_SECS = 5.0
+
+
+# Polling intervals grow geometrically from _MIN_POLL_SECS up to _MAX_POLL_SECS, with a bit
+# of jitter so that several bots don't end up hitting the API in lockstep.
+_MIN_POLL_SECS = 1.0
+_MAX_POLL_SECS = 30.0
+_POLL_BACKOFF_FACTOR = 1.5
+_POLL_JITTER_SECS = 0.5
+# How many times a queued (pending/created) pipeline is polled at _MIN_POLL_SECS before backing off.
+_EAGER_QUEUED_POLLS = 5
+
+
+def _backoff(waiting_time_in_secs):
+    return min(_MAX_POLL_SECS, waiting_time_in_secs * _POLL_BACKOFF_FACTOR)
+
+
+def _with_jitter(waiting_time_in_secs):
+    return waiting_time_in_secs + random.uniform(0, _POLL_JITTER_SECS)
+
+
+# Reviewer names and emails hardly ever change, so we look each one up only once per
+# process rather than once per approver per MR.
+_USER_CACHE = {}
+
+
+def _fetch_users(uids, api):
+    missing = [uid for uid in uids if (uid, api) not in _USER_CACHE]
+    for uid, user in zip(missing, User.fetch_many(missing, api)):
+        _USER_CACHE[(uid, api)] = user
+    return [_USER_CACHE[(uid, api)] for uid in uids]
+
+
 def _get_reviewer_names_and_emails(approvals, api):
     """Return a list ['A. Prover <a.prover@example.com', ...]` for `merge_request.`"""
 
     uids = approvals.approver_ids
-    return ['{0.name} <{0.email}>'.format(User.fetch_by_id(uid, api)) for uid in uids]
-
-
-JOB_OPTIONS = [
-    'add_tested',
-    'add_part_of',
-    'add_reviewers',
-    'reapprove',
-    'approval_timeout',
-    'embargo',
-    'ci_timeout',
-    'merge_strategy',
-    # bool - If true, require not just that a CI passed, but a CI run by marge.
+    return [f'{user.name} <{user.email}>' for user in _fetch_users(uids, api)]
+
+
+class MergeJobOptions(NamedTuple):
+    add_tested: bool = False
+    add_part_of: bool = False
+    add_reviewers: bool = False
+    reapprove: bool = False
+    approval_timeout: timedelta = timedelta(seconds=0)
+    embargo: IntervalUnion = IntervalUnion.empty()
+    ci_timeout: timedelta = timedelta(minutes=15)
+    merge_strategy: MergeStrategy = MergeStrategy.rebase
+    # If true, require not just that a CI passed, but a CI run by marge.
     # Start one if necessary.
-    'require_ci_run_by_me',
-    'ci_timeout_skip',
-]
-
-
-class MergeJobOptions(namedtuple('MergeJobOptions', JOB_OPTIONS)):
-    __slots__ = ()
+    require_ci_run_by_me: bool = False
+    ci_timeout_skip: bool = False
 
     @property
     def requests_commit_tagging(self):
         return self.add_tested or self.add_part_of or self.add_reviewers
 
-    @classmethod
-    def default(
-            cls, *,
-            add_tested=False, add_part_of=False, add_reviewers=False, reapprove=False,
-            approval_timeout=None, embargo=None, ci_timeout=None, ci_timeout_skip=False,
-            merge_strategy=MergeStrategy.rebase,
-            require_ci_run_by_me=False,
-    ):
-        approval_timeout = approval_timeout or timedelta(seconds=0)
-        embargo = embargo or IntervalUnion.empty()
-        ci_timeout = ci_timeout or timedelta(minutes=15)
-        return cls(
-            add_tested=add_tested,
-            add_part_of=add_part_of,
-            add_reviewers=add_reviewers,
-            reapprove=reapprove,
-            approval_timeout=approval_timeout,
-            embargo=embargo,
-            ci_timeout=ci_timeout,
-            ci_timeout_skip=ci_timeout_skip,
-            merge_strategy=merge_strategy,
-            require_ci_run_by_me=require_ci_run_by_me,
-        )
-
 
 class CannotMerge(Exception):
     @property
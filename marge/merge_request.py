@@ -1,3 +1,5 @@
+import time
+
 from . import gitlab
 from .approvals import Approvals
 
@@ -7,6 +9,10 @@ GET, POST, PUT, DELETE = gitlab.GET, gitlab.POST, gitlab.PUT, gitlab.DELETE
 
 class MergeRequest(gitlab.Resource):
 
+    def __init__(self, api, info):
+        super().__init__(api, info)
+        self._fetched_at = time.monotonic()
+
     @classmethod
     def create(cls, api, project_id, params):
         merge_request_info = api.call(POST(
@@ -104,8 +110,12 @@ class MergeRequest(gitlab.Resource):
     def web_url(self):
         return self.info['web_url']
 
-    def refetch_info(self):
+    def refetch_info(self, max_age=None):
+        """Refetch the info, unless `max_age` is given and it was fetched less than that many secs ago."""
+        if max_age is not None and time.monotonic() - self._fetched_at < max_age:
+            return
         self._info = self._api.call(GET('/projects/{0.project_id}/merge_requests/{0.iid}'.format(self)))
+        self._fetched_at = time.monotonic()
 
     def comment(self, message):
         if self._api.version().release >= (9, 2, 2):
@@ -17,6 +17,7 @@ class Pipeline(gitlab.Resource):
             order_by='id',
             sort='desc',
             username=None,
+            sha=None,
     ):
         params = {
             'ref': branch if ref is None else ref,
@@ -27,6 +28,8 @@ class Pipeline(gitlab.Resource):
             params['status'] = status
         if username is not None:
             params['username'] = username
+        if sha is not None:
+            params['sha'] = sha
         pipelines_info = api.call(GET(
             '/projects/{project_id}/pipelines'.format(project_id=project_id),
             params,
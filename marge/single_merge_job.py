@@ -1,13 +1,12 @@
 # pylint: disable=too-many-locals,too-many-branches,too-many-statements
 import logging as log
 import time
-from datetime import datetime
 
 from . import error
 from . import git
 from . import gitlab
 from .commit import Commit
-from .job import CannotMerge, MergeJob, SkipMerge
+from .job import CannotMerge, MergeJob, MR_INFO_MAX_AGE_SECS, SkipMerge
 
 
 class SingleMergeJob(MergeJob):
@@ -22,8 +21,8 @@ class SingleMergeJob(MergeJob):
         log.info('Processing !%s - %r', merge_request.iid, merge_request.title)
 
         try:
-            approvals = merge_request.fetch_approvals()
-            self.update_merge_request_and_accept(approvals)
+            # Only the very first check can rely on the info the bot has just listed.
+            self.update_merge_request_and_accept(max_info_age=MR_INFO_MAX_AGE_SECS if attempt == 0 else None)
             log.info('Successfully merged !%s.', merge_request.info['iid'])
         except SkipMerge as err:
             log.warning("Skipping MR !%s: %s", merge_request.info['iid'], err.reason)
@@ -50,18 +49,20 @@ class SingleMergeJob(MergeJob):
             self.unassign_from_mr(merge_request)
             raise
 
-    def update_merge_request_and_accept(self, approvals):
+    def update_merge_request_and_accept(self, max_info_age=None):
         api = self._api
         merge_request = self._merge_request
         updated_into_up_to_date_target_branch = False
 
         while not updated_into_up_to_date_target_branch:
-            self.ensure_mergeable_mr(merge_request)
+            approvals = self.ensure_mergeable_mr(merge_request, max_info_age=max_info_age)
+            max_info_age = None
             source_project, source_repo_url, _ = self.fetch_source_project(merge_request)
             # NB. this will be a no-op if there is nothing to update/rewrite
             target_sha, _updated_sha, actual_sha = self.update_from_target_branch_and_push(
                 merge_request,
                 source_repo_url=source_repo_url,
+                approvals=approvals,
             )
             log.info('Commit id to merge %r (into: %r)', actual_sha, target_sha)
             time.sleep(5)
@@ -148,10 +149,10 @@ class SingleMergeJob(MergeJob):
 
     def wait_for_branch_to_be_merged(self):
         merge_request = self._merge_request
-        time_0 = datetime.utcnow()
+        deadline = time.monotonic() + self._merge_timeout.total_seconds()
         waiting_time_in_secs = 10
 
-        while datetime.utcnow() - time_0 < self._merge_timeout:
+        while time.monotonic() < deadline:
             merge_request.refetch_info()
 
             if merge_request.state == 'merged':
@@ -29,6 +29,18 @@ class User(gitlab.Resource):
         info = api.call(GET('/users/%s' % user_id))
         return cls(api, info)
 
+    @classmethod
+    def fetch_many(cls, user_ids, api):
+        """Fetch the users with the given ids, in order, requesting each distinct id once.
+
+        The v4 API has no bulk lookup of users by id, so this is still one GET per user.
+        """
+        users = {}
+        for user_id in user_ids:
+            if user_id not in users:
+                users[user_id] = cls.fetch_by_id(user_id, api)
+        return [users[user_id] for user_id in user_ids]
+
     @classmethod
     def fetch_by_username(cls, username, api):
         info = api.call(GET(
@@ -175,7 +175,7 @@ class Api(gitlab.Api):
         self.add_transition(
             GET(
                 '/projects/%s/pipelines' % project_id,
-                args={'ref': info['ref'], 'order_by': 'id', 'sort': 'desc'},
+                args={'ref': info['ref'], 'order_by': 'id', 'sort': 'desc', 'sha': info['sha']},
             ),
             Ok([info]),
             sudo, from_state, to_state,
@@ -1,5 +1,8 @@
+# pylint: disable=protected-access
 import contextlib
 import datetime
+import io
+import logging
 import os
 import re
 import shlex
@@ -91,13 +94,13 @@ def test_default_values():
             assert bot.user.info == user_info
             assert bot.config.project_regexp == re.compile('.*')
             assert bot.config.git_timeout == datetime.timedelta(seconds=120)
-            assert bot.config.merge_opts == job.MergeJobOptions.default()
+            assert bot.config.merge_opts == job.MergeJobOptions()
 
 
 def test_embargo():
     with env(MARGE_AUTH_TOKEN="NON-ADMIN-TOKEN", MARGE_SSH_KEY="KEY", MARGE_GITLAB_URL='http://foo.com'):
         with main('--embargo="Fri 1pm-Mon 7am"') as bot:
-            assert bot.config.merge_opts == job.MergeJobOptions.default(
+            assert bot.config.merge_opts == job.MergeJobOptions(
                 embargo=interval.IntervalUnion.from_human('Fri 1pm-Mon 7am'),
             )
 
@@ -105,7 +108,7 @@ def test_embargo():
 def test_merge_strategy():
     with env(MARGE_AUTH_TOKEN="NON-ADMIN-TOKEN", MARGE_SSH_KEY="KEY", MARGE_GITLAB_URL='http://foo.com'):
         with main('--use-merge-strategy') as bot:
-            assert bot.config.merge_opts != job.MergeJobOptions.default()
+            assert bot.config.merge_opts != job.MergeJobOptions()
             assert bot.config.merge_opts.merge_strategy == job.MergeStrategy.merge
         with main('--merge-strategy=rebase') as bot:
             assert bot.config.merge_opts.merge_strategy == job.MergeStrategy.rebase
@@ -114,8 +117,8 @@ def test_merge_strategy():
 def test_add_tested():
     with env(MARGE_AUTH_TOKEN="NON-ADMIN-TOKEN", MARGE_SSH_KEY="KEY", MARGE_GITLAB_URL='http://foo.com'):
         with main('--add-tested') as bot:
-            assert bot.config.merge_opts != job.MergeJobOptions.default()
-            assert bot.config.merge_opts == job.MergeJobOptions.default(add_tested=True)
+            assert bot.config.merge_opts != job.MergeJobOptions()
+            assert bot.config.merge_opts == job.MergeJobOptions(add_tested=True)
 
 
 def test_use_merge_strategy_and_add_tested_are_mutualy_exclusive():
@@ -128,8 +131,8 @@ def test_use_merge_strategy_and_add_tested_are_mutualy_exclusive():
 def test_add_part_of():
     with env(MARGE_AUTH_TOKEN="NON-ADMIN-TOKEN", MARGE_SSH_KEY="KEY", MARGE_GITLAB_URL='http://foo.com'):
         with main('--add-part-of') as bot:
-            assert bot.config.merge_opts != job.MergeJobOptions.default()
-            assert bot.config.merge_opts == job.MergeJobOptions.default(add_part_of=True)
+            assert bot.config.merge_opts != job.MergeJobOptions()
+            assert bot.config.merge_opts == job.MergeJobOptions(add_part_of=True)
 
 
 def test_add_reviewers():
@@ -140,8 +143,8 @@ def test_add_reviewers():
 
     with env(MARGE_AUTH_TOKEN="ADMIN-TOKEN", MARGE_SSH_KEY="KEY", MARGE_GITLAB_URL='http://foo.com'):
         with main('--add-reviewers') as bot:
-            assert bot.config.merge_opts != job.MergeJobOptions.default()
-            assert bot.config.merge_opts == job.MergeJobOptions.default(add_reviewers=True)
+            assert bot.config.merge_opts != job.MergeJobOptions()
+            assert bot.config.merge_opts == job.MergeJobOptions(add_reviewers=True)
 
 
 def test_impersonate_approvers():
@@ -152,15 +155,15 @@ def test_impersonate_approvers():
 
     with env(MARGE_AUTH_TOKEN="ADMIN-TOKEN", MARGE_SSH_KEY="KEY", MARGE_GITLAB_URL='http://foo.com'):
         with main('--impersonate-approvers') as bot:
-            assert bot.config.merge_opts != job.MergeJobOptions.default()
-            assert bot.config.merge_opts == job.MergeJobOptions.default(reapprove=True)
+            assert bot.config.merge_opts != job.MergeJobOptions()
+            assert bot.config.merge_opts == job.MergeJobOptions(reapprove=True)
 
 
 def test_approval_reset_timeout():
     with env(MARGE_AUTH_TOKEN="NON-ADMIN-TOKEN", MARGE_SSH_KEY="KEY", MARGE_GITLAB_URL='http://foo.com'):
         with main('--approval-reset-timeout 1m') as bot:
-            assert bot.config.merge_opts != job.MergeJobOptions.default()
-            assert bot.config.merge_opts == job.MergeJobOptions.default(
+            assert bot.config.merge_opts != job.MergeJobOptions()
+            assert bot.config.merge_opts == job.MergeJobOptions(
                 approval_timeout=datetime.timedelta(seconds=60),
             )
 
@@ -174,8 +177,8 @@ def test_project_regexp():
 def test_ci_timeout():
     with env(MARGE_AUTH_TOKEN="NON-ADMIN-TOKEN", MARGE_SSH_KEY="KEY", MARGE_GITLAB_URL='http://foo.com'):
         with main("--ci-timeout 5m") as bot:
-            assert bot.config.merge_opts != job.MergeJobOptions.default()
-            assert bot.config.merge_opts == job.MergeJobOptions.default(
+            assert bot.config.merge_opts != job.MergeJobOptions()
+            assert bot.config.merge_opts == job.MergeJobOptions(
                 ci_timeout=datetime.timedelta(seconds=5*60),
             )
 
@@ -183,8 +186,8 @@ def test_ci_timeout():
 def test_deprecated_max_ci_time_in_minutes():
     with env(MARGE_AUTH_TOKEN="NON-ADMIN-TOKEN", MARGE_SSH_KEY="KEY", MARGE_GITLAB_URL='http://foo.com'):
         with main("--max-ci-time-in-minutes=5") as bot:
-            assert bot.config.merge_opts != job.MergeJobOptions.default()
-            assert bot.config.merge_opts == job.MergeJobOptions.default(
+            assert bot.config.merge_opts != job.MergeJobOptions()
+            assert bot.config.merge_opts == job.MergeJobOptions(
                 ci_timeout=datetime.timedelta(seconds=5*60),
             )
 
@@ -214,6 +217,32 @@ def test_time_interval():
     assert [app.time_interval(x) for x in ['15min', '15m', '.25h', '900s']] == [_900s] * 4
 
 
+def test_yaml_config_file_parser():
+    parsed = app._YAMLConfigFileParser().parse(io.StringIO('''
+ci-timeout: 5min
+add-tested: true
+embargo:
+project-regexp: [foo, bar]
+'''))
+    # Same as ConfigArgParse's own parser: a blank value is passed on as 'None'.
+    assert parsed == {
+        'ci-timeout': '5min', 'add-tested': 'True', 'embargo': 'None', 'project-regexp': ['foo', 'bar'],
+    }
+
+
+def test_yaml_config_file_parser_rejects_non_mapping():
+    with pytest.raises(app.configargparse.ConfigFileParserException):
+        app._YAMLConfigFileParser().parse(io.StringIO('- foo\n- bar\n'))
+
+
+def test_utc_formatter():
+    formatter = app._UTCFormatter(fmt='%(asctime)s: %(message)s')
+    record = logging.makeLogRecord({'msg': 'hello', 'created': 1520000000.5})
+    assert formatter.format(record) == '2018-03-02T14:13:20+0000: hello'
+    record = logging.makeLogRecord({'msg': 'again', 'created': 1520000001.0})
+    assert formatter.format(record) == '2018-03-02T14:13:21+0000: again'
+
+
 def test_disabled_auth_token_cli_arg():
     with env(MARGE_SSH_KEY="KEY", MARGE_GITLAB_URL='http://foo.com'):
         with pytest.raises(app.MargeBotCliArgError):
@@ -234,8 +263,8 @@ def test_config_file():
             admin_user_info = dict(**user_info)
             admin_user_info['is_admin'] = True
             assert bot.user.info == admin_user_info
-            assert bot.config.merge_opts != job.MergeJobOptions.default()
-            assert bot.config.merge_opts == job.MergeJobOptions.default(
+            assert bot.config.merge_opts != job.MergeJobOptions()
+            assert bot.config.merge_opts == job.MergeJobOptions(
                 embargo=interval.IntervalUnion.from_human('Fri 1pm-Mon 7am'),
                 add_tested=True,
                 add_part_of=True,
@@ -255,8 +284,8 @@ def test_config_overwrites():
                 admin_user_info = dict(**user_info)
                 admin_user_info['is_admin'] = True
                 assert bot.user.info == admin_user_info
-                assert bot.config.merge_opts != job.MergeJobOptions.default()
-                assert bot.config.merge_opts == job.MergeJobOptions.default(
+                assert bot.config.merge_opts != job.MergeJobOptions()
+                assert bot.config.merge_opts == job.MergeJobOptions(
                     embargo=interval.IntervalUnion.from_human('Fri 1pm-Mon 7am'),
                     add_tested=True,
                     add_part_of=True,
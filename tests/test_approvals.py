@@ -3,6 +3,7 @@ from unittest.mock import call, Mock, patch
 from marge.gitlab import Api, GET, POST, Version
 from marge.approvals import Approvals
 from marge.merge_request import MergeRequest
+import marge.job
 import marge.user
 # testing this here is more convenient
 from marge.job import _get_reviewer_names_and_emails
@@ -61,13 +62,15 @@ USERS = {
 }
 
 
-# pylint: disable=attribute-defined-outside-init
+# pylint: disable=attribute-defined-outside-init,protected-access
 class TestApprovals(object):
 
     def setup_method(self, _method):
         self.api = Mock(Api)
         self.api.version = Mock(return_value=Version.parse('9.2.3-ee'))
         self.approvals = Approvals(api=self.api, info=INFO)
+        # Don't let users cached by an earlier test turn our lookups into cache hits.
+        marge.job._USER_CACHE.clear()
 
     def test_fetch_from_merge_request(self):
         api = self.api
@@ -118,3 +121,11 @@ class TestApprovals(object):
             'Administrator <root@localhost>',
             'Roger Ebert <ebert@example.com>'
         ]
+
+    @patch('marge.user.User.fetch_by_id')
+    def test_get_reviewer_names_and_emails_caches_users(self, user_fetch_by_id):
+        user_fetch_by_id.side_effect = lambda id, _: marge.user.User(self.api, USERS[id])
+        first = _get_reviewer_names_and_emails(approvals=self.approvals, api=self.api)
+        second = _get_reviewer_names_and_emails(approvals=self.approvals, api=self.api)
+        assert first == second
+        assert user_fetch_by_id.call_count == 2
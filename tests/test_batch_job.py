@@ -8,7 +8,7 @@ import marge.project
 import marge.user
 from marge.batch_job import BatchMergeJob, CannotBatch
 from marge.gitlab import GET
-from marge.job import CannotMerge, MergeJobOptions
+from marge.job import CannotMerge, MergeJobOptions, SkipMerge
 from marge.merge_request import MergeRequest
 from tests.gitlab_api_mock import MockLab, Ok, commit
 
@@ -40,7 +40,7 @@ class TestBatchJob(object):
             'user': marge.user.User.myself(api),
             'project': marge.project.Project.fetch_by_id(project_id, api),
             'repo': create_autospec(marge.git.Repo, spec_set=True),
-            'options': MergeJobOptions.default(),
+            'options': MergeJobOptions(),
             'merge_requests': [merge_request]
         }
         params.update(batch_merge_kwargs)
@@ -130,6 +130,52 @@ class TestBatchJob(object):
 
         assert str(exc_info.value) == 'This MR has not passed CI.'
 
+    def _mergeable_mr(self, batch_merge_job, **options):
+        params = dict(
+            assignee_ids=[batch_merge_job._user.id],
+            state='opened',
+            work_in_progress=False,
+            squash=False,
+        )
+        params.update(options)
+        return self._mock_merge_request(**params)
+
+    @patch.object(BatchMergeJob, 'get_mr_ci_status')
+    def test_ensure_mergeable_mr_checks_approvals_and_ci(self, bmj_get_mr_ci_status, api, mocklab):
+        batch_merge_job = self.get_batch_merge_job(api, mocklab)
+        bmj_get_mr_ci_status.return_value = 'success'
+        merge_request = self._mergeable_mr(batch_merge_job)
+        merge_request.fetch_approvals.return_value.sufficient = True
+
+        approvals = batch_merge_job.ensure_mergeable_mr(merge_request)
+
+        assert approvals is merge_request.fetch_approvals.return_value
+        bmj_get_mr_ci_status.assert_called_once_with(merge_request)
+
+    @patch.object(BatchMergeJob, 'get_mr_ci_status')
+    def test_ensure_mergeable_mr_insufficient_approvals_before_ci(self, bmj_get_mr_ci_status, api, mocklab):
+        batch_merge_job = self.get_batch_merge_job(api, mocklab)
+        bmj_get_mr_ci_status.return_value = 'failed'
+        merge_request = self._mergeable_mr(batch_merge_job)
+        merge_request.fetch_approvals.return_value.sufficient = False
+
+        with pytest.raises(CannotMerge) as exc_info:
+            batch_merge_job.ensure_mergeable_mr(merge_request)
+
+        assert not isinstance(exc_info.value, CannotBatch)
+        assert 'Insufficient approvals' in str(exc_info.value)
+
+    @patch.object(BatchMergeJob, 'get_mr_ci_status')
+    def test_ensure_mergeable_mr_not_assigned_makes_no_more_calls(self, bmj_get_mr_ci_status, api, mocklab):
+        batch_merge_job = self.get_batch_merge_job(api, mocklab)
+        merge_request = self._mergeable_mr(batch_merge_job, assignee_ids=[])
+
+        with pytest.raises(SkipMerge):
+            batch_merge_job.ensure_mergeable_mr(merge_request)
+
+        merge_request.fetch_approvals.assert_not_called()
+        bmj_get_mr_ci_status.assert_not_called()
+
     def test_push_batch(self, api, mocklab):
         batch_merge_job = self.get_batch_merge_job(api, mocklab)
         batch_merge_job.push_batch()
@@ -158,7 +204,7 @@ class TestBatchJob(object):
         batch_merge_job = self.get_batch_merge_job(api, mocklab)
         merge_request = self._mock_merge_request(target_branch='master')
         with pytest.raises(CannotBatch) as exc_info:
-            batch_merge_job.accept_mr(merge_request, 'abc')
+            batch_merge_job.accept_mr(merge_request, 'abc', merge_request.fetch_approvals.return_value)
         assert str(exc_info.value) == 'Someone was naughty and by-passed marge'
 
     def test_fuse_mr_when_source_branch_was_moved(self, api, mocklab):
@@ -179,6 +225,8 @@ class TestBatchJob(object):
         )
 
         with pytest.raises(CannotMerge) as exc_info:
-            batch_merge_job.accept_mr(merge_request, mocklab.initial_master_sha)
+            batch_merge_job.accept_mr(
+                merge_request, mocklab.initial_master_sha, merge_request.fetch_approvals.return_value,
+            )
 
         assert str(exc_info.value) == 'Someone pushed to branch while we were trying to merge'
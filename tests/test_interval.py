@@ -44,11 +44,13 @@ class TestIntervalUnion(object):
     def test_empty(self):
         empty_interval = IntervalUnion.empty()
         assert empty_interval == IntervalUnion([])
+        assert not empty_interval
         assert not empty_interval.covers(date('Monday 5pm'))
 
     def test_singleton(self):
         weekly = WeeklyInterval('Mon', time(10, 00), 'Fri', time(18, 00))
         interval = IntervalUnion([weekly])
+        assert interval
         assert interval.covers(date('Tuesday 3pm'))
         assert not interval.covers(date('Sunday 5pm'))
 
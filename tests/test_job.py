@@ -5,6 +5,7 @@ from unittest.mock import ANY, Mock, patch, create_autospec
 import pytest
 
 from marge.job import CannotMerge, MergeJob, MergeJobOptions, SkipMerge, MergeStrategy
+import marge.approvals
 import marge.interval
 import marge.git
 import marge.gitlab
@@ -23,7 +24,7 @@ class TestJob(object):
             'user': create_autospec(marge.user.User, spec_set=True),
             'project': create_autospec(marge.project.Project, spec_set=True),
             'repo': create_autospec(marge.git.Repo, spec_set=True),
-            'options': MergeJobOptions.default(),
+            'options': MergeJobOptions(),
         }
         params.update(merge_kwargs)
         return MergeJob(**params)
@@ -48,6 +49,26 @@ class TestJob(object):
             assert r_source_project is not merge_job._project
             assert r_source_project is project_class.fetch_by_id.return_value
 
+    def test_get_source_project_is_fetched_once_per_job(self):
+        with patch('marge.job.Project') as project_class:
+            merge_job = self.get_merge_job()
+            merge_request = self._mock_merge_request()
+            first = merge_job.get_source_project(merge_request)
+            second = merge_job.get_source_project(merge_request)
+
+            project_class.fetch_by_id.assert_called_once()
+            assert first is second
+
+    def test_is_protected_branch_is_fetched_once_per_job(self):
+        with patch('marge.job.Branch') as branch_class:
+            branch_class.fetch_by_name.return_value.protected = True
+            merge_job = self.get_merge_job()
+
+            assert merge_job.is_protected_branch(1234, 'feature')
+            assert merge_job.is_protected_branch(1234, 'feature')
+
+            branch_class.fetch_by_name.assert_called_once_with(1234, 'feature', merge_job._api)
+
     def test_get_mr_ci_status(self):
         with patch('marge.job.Pipeline', autospec=True) as pipeline_class:
             pipeline_class.pipelines_by_branch.return_value = [
@@ -63,13 +84,26 @@ class TestJob(object):
                 merge_request.source_branch,
                 merge_job._api,
                 username=None,
+                sha='abc',
             )
             assert r_ci_status == 'success'
 
+    def test_get_mr_ci_status_ignores_pipelines_for_other_commits(self):
+        with patch('marge.job.Pipeline', autospec=True) as pipeline_class:
+            # e.g. a GitLab that doesn't support filtering by sha
+            pipeline_class.pipelines_by_branch.return_value = [
+                Mock(sha='old', status='success'),
+                Mock(sha='abc', status='running'),
+            ]
+            merge_job = self.get_merge_job()
+
+            assert merge_job.get_mr_ci_status(self._mock_merge_request(sha='abc')) == 'running'
+            assert merge_job.get_mr_ci_status(self._mock_merge_request(sha='new')) is None
+
     def test_require_ci_run_by_me(self):
         with patch('marge.job.Pipeline', autospec=True) as pipeline_class, patch('time.sleep'):
             merge_job = self.get_merge_job(
-                options=MergeJobOptions.default(
+                options=MergeJobOptions(
                     ci_timeout=timedelta(seconds=1),
                     require_ci_run_by_me=True))
             merge_job._user.username = 'marge'
@@ -89,9 +123,45 @@ class TestJob(object):
                 merge_request.source_branch,
                 merge_job._api,
                 username='marge',
+                sha='abc',
             )
             assert pipeline_class.start.call_count == 1
 
+    def _ci_sleeps(self, statuses):
+        with patch('marge.job.Pipeline', autospec=True) as pipeline_class, \
+                patch('time.sleep') as sleep, patch('random.uniform', return_value=0):
+            merge_job = self.get_merge_job()
+            merge_request = self._mock_merge_request(sha='abc')
+
+            statuses = list(statuses)
+            pipeline_class.pipelines_by_branch.side_effect = lambda *args, **kw: [
+                Mock(sha='abc', status=statuses.pop(0)),
+            ]
+            merge_job.wait_for_ci_to_pass(merge_request)
+
+            return [args[0] for args, _ in sleep.call_args_list]
+
+    def test_wait_for_ci_backs_off_only_while_running(self):
+        sleeps = self._ci_sleeps(['pending', 'pending', 'running', 'running', 'running', 'success'])
+        assert sleeps == [1.0, 1.0, 1.0, 1.5, 2.25]
+
+    def test_wait_for_ci_backs_off_after_a_long_pending_stretch(self):
+        sleeps = self._ci_sleeps(['pending'] * 40 + ['success'])
+        assert sleeps[:6] == [1.0] * 6
+        assert sleeps[6:9] == [1.5, 2.25, 3.375]
+        assert sleeps[-1] == 30.0
+
+    def test_maybe_reapprove_fetches_approvals_once_when_not_waiting(self):
+        merge_job = self.get_merge_job(options=MergeJobOptions(reapprove=True))
+        merge_request = self._mock_merge_request()
+        merge_request.fetch_approvals.return_value.sufficient = False
+        approvals = create_autospec(marge.approvals.Approvals, spec_set=True)
+
+        merge_job.maybe_reapprove(merge_request, approvals)
+
+        merge_request.fetch_approvals.assert_called_once()
+        approvals.reapprove.assert_called_once()
+
     def test_ensure_mergeable_mr_not_assigned(self):
         merge_job = self.get_merge_job()
         merge_request = self._mock_merge_request(
@@ -102,6 +172,23 @@ class TestJob(object):
         with pytest.raises(SkipMerge) as exc_info:
             merge_job.ensure_mergeable_mr(merge_request)
         assert exc_info.value.reason == 'It is not assigned to me anymore!'
+        merge_request.fetch_approvals.assert_not_called()
+
+    def test_ensure_mergeable_mr_returns_approvals(self):
+        merge_job = self.get_merge_job()
+        merge_request = self._mock_merge_request(
+            assignee_ids=[merge_job._user.id],
+            state='opened',
+            work_in_progress=False,
+            squash=False,
+        )
+        merge_request.fetch_approvals.return_value.sufficient = True
+
+        approvals = merge_job.ensure_mergeable_mr(merge_request)
+
+        merge_request.refetch_info.assert_called_once_with(max_age=None)
+        merge_request.fetch_approvals.assert_called_once()
+        assert approvals is merge_request.fetch_approvals.return_value
 
     def test_ensure_mergeable_mr_state_not_ok(self):
         merge_job = self.get_merge_job()
@@ -144,7 +231,7 @@ class TestJob(object):
         assert exc_info.value.reason == "Sorry, I can't merge requests marked as Work-In-Progress!"
 
     def test_ensure_mergeable_mr_squash_and_trailers(self):
-        merge_job = self.get_merge_job(options=MergeJobOptions.default(add_reviewers=True))
+        merge_job = self.get_merge_job(options=MergeJobOptions(add_reviewers=True))
         merge_request = self._mock_merge_request(
             assignee_id=merge_job._user.id,
             state='opened',
@@ -175,7 +262,7 @@ class TestJob(object):
 
     def test_fuse_using_rebase(self):
         merge_job = self.get_merge_job(
-            options=MergeJobOptions.default(merge_strategy=MergeStrategy.rebase))
+            options=MergeJobOptions(merge_strategy=MergeStrategy.rebase))
         branch_a = 'A'
         branch_b = 'B'
 
@@ -190,7 +277,7 @@ class TestJob(object):
 
     def test_fuse_using_merge(self):
         merge_job = self.get_merge_job(
-            options=MergeJobOptions.default(merge_strategy=MergeStrategy.merge))
+            options=MergeJobOptions(merge_strategy=MergeStrategy.merge))
         branch_a = 'A'
         branch_b = 'B'
 
@@ -206,7 +293,7 @@ class TestJob(object):
 
 class TestMergeJobOptions(object):
     def test_default(self):
-        assert MergeJobOptions.default() == MergeJobOptions(
+        assert MergeJobOptions() == MergeJobOptions(
             add_tested=False,
             add_part_of=False,
             add_reviewers=False,
@@ -216,10 +303,11 @@ class TestMergeJobOptions(object):
             ci_timeout=timedelta(minutes=15),
             merge_strategy=MergeStrategy.rebase,
             require_ci_run_by_me=False,
+            ci_timeout_skip=False,
         )
 
     def test_default_ci_time(self):
         three_min = timedelta(minutes=3)
-        assert MergeJobOptions.default(ci_timeout=three_min) == MergeJobOptions.default()._replace(
+        assert MergeJobOptions(ci_timeout=three_min) == MergeJobOptions()._replace(
             ci_timeout=three_min
         )
@@ -47,6 +47,18 @@ class TestMergeRequest(object):
         self.api.call.assert_called_once_with(GET('/projects/1234/merge_requests/54'))
         assert self.merge_request.info == new_info
 
+    def test_refetch_info_with_max_age(self):
+        new_info = dict(INFO, state='closed')
+        self.api.call = Mock(return_value=new_info)
+
+        self.merge_request.refetch_info(max_age=60)
+        self.api.call.assert_not_called()
+        assert self.merge_request.info == INFO
+
+        self.merge_request.refetch_info(max_age=0)
+        self.api.call.assert_called_once_with(GET('/projects/1234/merge_requests/54'))
+        assert self.merge_request.info == new_info
+
     def test_properties(self):
         assert self.merge_request.id == 42
         assert self.merge_request.project_id == 1234
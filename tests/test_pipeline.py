@@ -30,6 +30,17 @@ class TestPipeline(object):
         ))
         assert [pl.info for pl in result] == [pl1, pl2]
 
+    def test_pipelines_by_branch_and_sha(self):
+        api = self.api
+        api.call = Mock(return_value=[INFO])
+
+        result = Pipeline.pipelines_by_branch(project_id=1234, branch=INFO['ref'], api=api, sha=INFO['sha'])
+        api.call.assert_called_once_with(GET(
+            '/projects/1234/pipelines',
+            {'ref': INFO['ref'], 'order_by': 'id', 'sort': 'desc', 'sha': INFO['sha']},
+        ))
+        assert [pl.info for pl in result] == [INFO]
+
     def test_properties(self):
         pipeline = Pipeline(api=self.api, project_id=1234, info=INFO)
         assert pipeline.id == 47
@@ -2,7 +2,7 @@ import contextlib
 from collections import namedtuple
 from datetime import timedelta
 from functools import partial
-from unittest.mock import ANY, patch, create_autospec
+from unittest.mock import ANY, DEFAULT, Mock, call, patch, create_autospec
 
 import pytest
 
@@ -15,6 +15,7 @@ import marge.project
 import marge.single_merge_job
 import marge.user
 from marge.gitlab import GET, PUT
+from marge.job import CannotMerge
 from marge.merge_request import MergeRequest
 from tests.gitlab_api_mock import Error, Ok, MockLab
 
@@ -182,7 +183,7 @@ class TestUpdateAndAccept(object):
         merge_request = MergeRequest.fetch_by_iid(project_id, merge_request_iid, api)
 
         repo = create_autospec(marge.git.Repo, spec_set=True)
-        options = options or marge.job.MergeJobOptions.default()
+        options = options or marge.job.MergeJobOptions()
         user = marge.user.User.myself(api)
         return marge.single_merge_job.SingleMergeJob(
             api=api, user=user,
@@ -195,7 +196,7 @@ class TestUpdateAndAccept(object):
             job = self.make_job(
                 api,
                 mocklab,
-                options=marge.job.MergeJobOptions.default(add_tested=True, add_reviewers=False),
+                options=marge.job.MergeJobOptions(add_tested=True, add_reviewers=False),
             )
             job.execute()
 
@@ -221,7 +222,7 @@ class TestUpdateAndAccept(object):
             job = self.make_job(
                 api,
                 mocklab,
-                options=marge.job.MergeJobOptions.default(add_tested=True, add_reviewers=False),
+                options=marge.job.MergeJobOptions(add_tested=True, add_reviewers=False),
             )
             job.execute()
 
@@ -244,7 +245,7 @@ class TestUpdateAndAccept(object):
             job = self.make_job(
                 api,
                 mocklab,
-                options=marge.job.MergeJobOptions.default(add_tested=True, add_reviewers=False),
+                options=marge.job.MergeJobOptions(add_tested=True, add_reviewers=False),
             )
             job.execute()
 
@@ -274,7 +275,7 @@ class TestUpdateAndAccept(object):
             job = self.make_job(
                 api,
                 mocklab,
-                options=marge.job.MergeJobOptions.default(add_tested=True, add_reviewers=False),
+                options=marge.job.MergeJobOptions(add_tested=True, add_reviewers=False),
             )
             job.execute()
 
@@ -298,7 +299,7 @@ class TestUpdateAndAccept(object):
                 job = self.make_job(
                     api,
                     mocklab,
-                    options=marge.job.MergeJobOptions.default(),
+                    options=marge.job.MergeJobOptions(),
                 )
                 job.execute()
 
@@ -321,7 +322,7 @@ class TestUpdateAndAccept(object):
                 job = self.make_job(
                     api,
                     mocklab,
-                    options=marge.job.MergeJobOptions.default(),
+                    options=marge.job.MergeJobOptions(),
                 )
                 job.execute()
 
@@ -345,7 +346,7 @@ class TestUpdateAndAccept(object):
                 job = self.make_job(
                     api,
                     mocklab,
-                    options=marge.job.MergeJobOptions.default(add_tested=True, add_reviewers=False),
+                    options=marge.job.MergeJobOptions(add_tested=True, add_reviewers=False),
                 )
                 job.execute()
 
@@ -370,7 +371,7 @@ class TestUpdateAndAccept(object):
             job = self.make_job(
                 api,
                 mocklab,
-                options=marge.job.MergeJobOptions.default(add_tested=True, add_reviewers=False),
+                options=marge.job.MergeJobOptions(add_tested=True, add_reviewers=False),
             )
             job.repo.push.side_effect = marge.git.GitError()
             job.execute()
@@ -425,7 +426,7 @@ class TestUpdateAndAccept(object):
             job = self.make_job(
                 api,
                 mocklab,
-                options=marge.job.MergeJobOptions.default(add_tested=True, add_reviewers=False),
+                options=marge.job.MergeJobOptions(add_tested=True, add_reviewers=False),
             )
             job.execute()
 
@@ -563,7 +564,7 @@ class TestUpdateAndAccept(object):
                 job = self.make_job(
                     api,
                     mocklab,
-                    options=marge.job.MergeJobOptions.default(**{rewriting_opt: True}),
+                    options=marge.job.MergeJobOptions(**{rewriting_opt: True}),
                 )
                 job.execute()
 
@@ -580,7 +581,7 @@ class TestUpdateAndAccept(object):
             job = self.make_job(
                 api,
                 mocklab,
-                options=marge.job.MergeJobOptions.default(
+                options=marge.job.MergeJobOptions(
                     approval_timeout=timedelta(seconds=5), reapprove=True,
                 ),
             )
@@ -602,3 +603,76 @@ class TestUpdateAndAccept(object):
 
         assert api.state == 'initial'
         assert api.notes == ["I couldn't merge this branch: {}".format(expected_message)]
+
+
+class TestApprovalsAndRetries(object):
+    def make_job(self):
+        merge_request = create_autospec(MergeRequest, spec_set=True)
+        job = marge.single_merge_job.SingleMergeJob(
+            api=create_autospec(marge.gitlab.Api, spec_set=True),
+            user=create_autospec(marge.user.User, spec_set=True),
+            project=create_autospec(marge.project.Project, spec_set=True),
+            repo=create_autospec(marge.git.Repo, spec_set=True),
+            options=marge.job.MergeJobOptions(),
+            merge_request=merge_request,
+        )
+        return job, merge_request
+
+    @contextlib.contextmanager
+    def patched_job(self):
+        job, merge_request = self.make_job()
+        source_project = create_autospec(marge.project.Project, spec_set=True)
+        source_project.only_allow_merge_if_pipeline_succeeds = False
+        with patch.multiple(
+                job,
+                ensure_mergeable_mr=DEFAULT,
+                fetch_source_project=DEFAULT,
+                update_from_target_branch_and_push=DEFAULT,
+                maybe_reapprove=DEFAULT,
+                wait_for_branch_to_be_merged=DEFAULT,
+        ) as mocks, patch('marge.single_merge_job.Commit') as commit_class, patch('time.sleep'):
+            mocks['fetch_source_project'].return_value = (source_project, None, 'origin')
+            mocks['update_from_target_branch_and_push'].return_value = ('target', 'updated', 'rewritten')
+            commit_class.last_on_branch.return_value.id = 'rewritten'
+            yield job, merge_request, mocks
+
+    def test_reuses_approvals_from_ensure_mergeable_mr(self):
+        with self.patched_job() as (job, merge_request, mocks):
+            approvals = mocks['ensure_mergeable_mr'].return_value
+
+            job.update_merge_request_and_accept()
+
+            merge_request.fetch_approvals.assert_not_called()
+            mocks['update_from_target_branch_and_push'].assert_called_once_with(
+                merge_request, source_repo_url=None, approvals=approvals,
+            )
+            mocks['maybe_reapprove'].assert_called_once_with(merge_request, approvals)
+
+    def test_only_first_check_of_first_attempt_may_skip_refetch(self):
+        with self.patched_job() as (job, merge_request, mocks):
+            mocks['ensure_mergeable_mr'].side_effect = [CannotMerge('nope'), ANY, ANY]
+
+            job.execute()
+
+            assert mocks['ensure_mergeable_mr'].call_args_list == [
+                call(merge_request, max_info_age=marge.job.MR_INFO_MAX_AGE_SECS),
+                call(merge_request, max_info_age=None),
+                call(merge_request),
+            ]
+
+    def test_refetches_after_target_branch_moved(self):
+        with self.patched_job() as (job, merge_request, mocks), \
+                patch('marge.single_merge_job.Commit') as commit_class:
+            commit_class.last_on_branch.side_effect = [
+                Mock(id='rewritten'), Mock(id='moved'), Mock(id='rewritten'),
+            ]
+            merge_request.accept.side_effect = [marge.gitlab.NotAcceptable(406, 'moved'), None]
+
+            job.update_merge_request_and_accept(max_info_age=marge.job.MR_INFO_MAX_AGE_SECS)
+
+            assert mocks['ensure_mergeable_mr'].call_args_list == [
+                call(merge_request, max_info_age=marge.job.MR_INFO_MAX_AGE_SECS),
+                call(merge_request),
+                call(merge_request, max_info_age=None),
+                call(merge_request),
+            ]
@@ -1,4 +1,4 @@
-from unittest.mock import ANY, Mock
+from unittest.mock import ANY, Mock, call
 
 from marge.gitlab import Api, GET
 from marge.user import User
@@ -31,6 +31,15 @@ class TestProjectWithUser(object):
         api.call.assert_called_once_with(GET('/users/1234'))
         assert user.info == INFO
 
+    def test_fetch_many(self):
+        api = self.api
+        api.call = Mock(side_effect=lambda command: dict(INFO, id=int(command.endpoint.split('/')[-1])))
+
+        users = User.fetch_many([1234, 42, 1234], api=api)
+
+        assert api.call.call_args_list == [call(GET('/users/1234')), call(GET('/users/42'))]
+        assert [user.id for user in users] == [1234, 42, 1234]
+
     def test_fetch_by_username_exists(self):
         api = self.api
         api.call = Mock(return_value=INFO)